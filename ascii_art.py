@@ -4,6 +4,9 @@ ASCII Art Generator - Simple Interface with Live Animation
 Creates mathematically unique ASCII art patterns with live evolution.
 """
 
+import time
+from datetime import datetime
+
 from wrapper import AsciiArtGenerator
 
 
@@ -13,7 +16,7 @@ def single_generation():
     generator.display()
 
 
-def live_animation(max_generations=None, delay=0.5):
+def live_animation(max_generations=None, delay=4.0):
     """Watch patterns evolve live like Conway's Game of Life"""
     generator = AsciiArtGenerator()
     print(f"Starting live evolution...")
@@ -26,20 +29,20 @@ def live_animation(max_generations=None, delay=0.5):
     generator.animate(max_generations=max_generations, delay=delay)
 
 
-def multiple_generations(count=3):
-    """Generate multiple unique pieces"""
+def multiple_generations(count=3, interactive=True):
+    """Generate multiple unique pieces, pausing between them when interactive"""
     generator = AsciiArtGenerator()
 
     print("Generating multiple unique ASCII art pieces...\n")
 
-    for i in range(count):
+    results = generator.create_many(count)
+    for i, result in enumerate(results):
         print(f"\nGeneration {i+1}:")
         print("-" * 50)
-        result = generator.create()
         print(result["art"])
         print(f"Steps: {result['steps']} | Position: {result['sequence_position']}")
 
-        if i < count - 1:
+        if interactive and i < count - 1:
             input("\nPress Enter for next generation...")
 
 
@@ -47,9 +50,12 @@ def save_collection():
     """Generate and save multiple pieces to files"""
     generator = AsciiArtGenerator()
 
+    # Pieces are fetched together, so number them to keep the file names unique
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
     files = []
-    for i in range(3):
-        filename = generator.save_to_file()
+    for i, result in enumerate(generator.create_many(3), 1):
+        filename = generator.save_to_file(f"ascii_art_{timestamp}_{i}.txt", result)
         files.append(filename)
         print(f"Generated {filename}")
 
@@ -72,6 +78,7 @@ Commands:
   fast            - Fast live evolution (0.1s per frame)
   slow            - Slow live evolution (1.0s per frame)
   multi           - Generate 5 different patterns
+  bench [N]       - Generate N patterns (default 5) without pausing, timed
   save            - Generate and save 3 patterns to files
   help            - Show this help
 
@@ -90,8 +97,12 @@ Live Mode Controls:
 
 
 if __name__ == "__main__":
+    import os
     import sys
 
+    if os.name == "nt":
+        os.system("")  # Enable ANSI escape processing in the Windows console
+
     if len(sys.argv) < 2:
         # Default behavior - show help and demo
         print("Non-Repeating ASCII Art Generator")
@@ -119,6 +130,14 @@ if __name__ == "__main__":
         elif command == "multi":
             multiple_generations(5)
 
+        elif command == "bench":
+            count = 5
+            if len(sys.argv) > 2 and sys.argv[2].isdigit():
+                count = int(sys.argv[2])
+            start = time.perf_counter()
+            multiple_generations(count, interactive=False)
+            print(f"\nGenerated {count} patterns in {time.perf_counter() - start:.2f}s")
+
         elif command == "save":
             save_collection()
 
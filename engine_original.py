@@ -4,139 +4,230 @@ Non-Repeating ASCII Art Generator
 Mathematical art that never repeats - powered by computational mathematics.
 """
 
+import hashlib
+import math
 import numpy as np
 import time
 import os
-from decimal import Decimal, getcontext
+import sys
+from decimal import Decimal, localcontext
 from typing import List, Tuple
 from datetime import datetime
 
+# Cursor home + erase display: redraws in place without a full terminal reset
+_CLEAR = "\x1b[H\x1b[2J"
+
+# Digit strings and read-only digit arrays keyed by precision, shared by
+# every MathEngine in the process
+_SEQUENCE_CACHE = {}
+_DIGITS_CACHE = {}
+
+# Chudnovsky series constant 640320^3 / 24
+_C3_OVER_24 = 640320**3 // 24
+
+
+def _chudnovsky_split(a, b):
+    """Binary splitting of the Chudnovsky series over terms [a, b)"""
+    if b - a == 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * _C3_OVER_24
+        t = p * (13591409 + 545140134 * a)
+        if a & 1:
+            t = -t
+        return p, q, t
+
+    m = (a + b) // 2
+    p_left, q_left, t_left = _chudnovsky_split(a, m)
+    p_right, q_right, t_right = _chudnovsky_split(m, b)
+    return p_left * p_right, q_left * q_right, q_right * t_left + p_left * t_right
+
+
+def _pi_chudnovsky_bs(prec):
+    """Compute pi to prec digits using the Chudnovsky series with binary splitting"""
+    terms = math.ceil(prec / 14.1816) + 1
+    _, q, t = _chudnovsky_split(0, terms)
+
+    # Only the final sqrt and division need Decimal, at a local precision
+    with localcontext() as ctx:
+        ctx.prec = prec
+        return Decimal(q * 426880) * Decimal(10005).sqrt() / Decimal(t)
+
+
+def make_stepper(height, width):
+    """Build an evolution step specialised to a height x width toroidal grid.
+
+    The returned step(grid, new_grid) writes the next generation of grid into
+    new_grid using int8 scratch buffers and views fixed at construction, so a
+    step allocates no arrays and slices nothing.
+    """
+    padded = np.zeros((height + 2, width + 2), dtype=np.int8)
+    row_sums = np.zeros((height + 2, width), dtype=np.int8)
+    neighbor_count = np.zeros((height, width), dtype=np.int8)
+
+    # Toroidal halo: rows are wrapped first, then full columns (with corners)
+    interior = padded[1:-1, 1:-1]
+    top_halo, bottom_halo = padded[0, 1:-1], padded[-1, 1:-1]
+    left_halo, right_halo = padded[:, 0], padded[:, -1]
+    last_column, first_column = padded[:, -2], padded[:, 1]
+
+    # Shifted views for the separable 3x3 box sum
+    west, middle, east = padded[:, :-2], padded[:, 1:-1], padded[:, 2:]
+    north, centre, south = row_sums[:-2], row_sums[1:-1], row_sums[2:]
+
+    def step(grid, new_grid):
+        np.copyto(interior, grid)
+        np.copyto(top_halo, grid[-1])
+        np.copyto(bottom_halo, grid[0])
+        np.copyto(left_halo, last_column)
+        np.copyto(right_halo, first_column)
+
+        # Horizontal triples are shared by the three rows that use them
+        np.add(west, middle, out=row_sums)
+        np.add(row_sums, east, out=row_sums)
+        np.add(north, centre, out=neighbor_count)
+        np.add(neighbor_count, south, out=neighbor_count)
+        np.subtract(neighbor_count, grid, out=neighbor_count)
+
+        # Standard cellular automaton rules: (count | alive) == 3 holds exactly
+        # for a birth on 3 neighbours or survival on 2 or 3
+        np.bitwise_or(neighbor_count, grid, out=neighbor_count)
+        np.equal(neighbor_count, 3, out=new_grid)
+
+    return step
+
 
 class MathEngine:
     """High-precision mathematical computation engine"""
 
     def __init__(self, precision=500):
-        getcontext().prec = precision + 10
-        self.sequence = self._compute_sequence(precision)
-        self.position = int(time.time() * 1000000) % len(self.sequence)
+        self.precision = precision
+        self._sequence = None
+        self._digits = None
+        # The digit string holds precision - 1 digits after the decimal point
+        self.position = int(time.time() * 1000000) % (precision - 1)
+
+    @property
+    def sequence(self):
+        """Digit string, computed on first use"""
+        if self._sequence is None:
+            self._sequence = self._compute_sequence(self.precision)
+        return self._sequence
+
+    @property
+    def digits(self):
+        """Digit sequence as an integer array"""
+        if self._digits is None:
+            if self.precision not in _DIGITS_CACHE:
+                raw = np.frombuffer(self.sequence.encode("ascii"), dtype=np.uint8)
+                digits = (raw - ord("0")).astype(np.int64)
+                digits.setflags(write=False)
+                _DIGITS_CACHE[self.precision] = digits
+            self._digits = _DIGITS_CACHE[self.precision]
+        return self._digits
 
     def _compute_sequence(self, precision):
         """Compute mathematical constant using advanced series"""
-        getcontext().prec = precision + 10
-        result = 4 * (
-            4 * self._arctan_series(Decimal(1) / 5)
-            - self._arctan_series(Decimal(1) / 239)
-        )
-        return str(result).replace(".", "")[1:precision]
-
-    def _arctan_series(self, x):
-        """Compute arctangent using infinite series"""
-        power = x
-        result = x
-        i = 1
-        while True:
-            power *= -x * x
-            term = power / (2 * i + 1)
-            if abs(term) < Decimal(10) ** -getcontext().prec:
-                break
-            result += term
-            i += 1
-        return result
+        if precision not in _SEQUENCE_CACHE:
+            result = _pi_chudnovsky_bs(precision + 10)
+            _SEQUENCE_CACHE[precision] = str(result).replace(".", "")[1:precision]
+        return _SEQUENCE_CACHE[precision]
 
     def next_values(self, length=8):
         """Extract next sequence of values"""
-        if self.position + length >= len(self.sequence):
+        digits = self.digits
+        if self.position + length >= len(digits):
             self.position = 0
-        values = [int(d) for d in self.sequence[self.position : self.position + length]]
+        values = digits[self.position : self.position + length]
         self.position += length
         return values
 
+    def stream_values(self, count):
+        """Extract count values, matching count successive next_values(1) calls"""
+        digits = self.digits
+        period = len(digits) - 1
+        start = self.position if self.position < period else 0
+        indices = (start + np.arange(count)) % period
+        if count:
+            self.position = int(indices[-1]) + 1
+        return digits[indices]
+
 
 class PatternEngine:
     """Cellular automaton pattern generator with mathematical constraints"""
 
     def __init__(self, width=80, height=24):
         self.width, self.height = width, height
-        self.grid = np.zeros((height, width), dtype=int)
+        self.grid = np.zeros((height, width), dtype=np.int8)
+        self._new_grid = np.zeros_like(self.grid)
+        self._step = make_stepper(height, width)
         self.math_engine = MathEngine()
         self.generation = 0
         self.perturbation_rate = 0.08
 
         # Character mapping for visual output
         self.visual_chars = [" ", "░", "▒", "▓", "█", "◆", "●", "♦", "★"]
+        # Digit -> character table, padded with the last character so that
+        # every digit 0-9 indexes it directly
+        padding = [self.visual_chars[-1]] * (10 - len(self.visual_chars))
+        self._char_lut = np.array(self.visual_chars + padding, dtype="<U1")
 
-        # Pattern analysis history
-        self.pattern_history = []
-
-    def apply_rules(self, i, j, grid):
-        """Apply cellular automaton evolution rules"""
-        neighbor_count = 0
-        for di in [-1, 0, 1]:
-            for dj in [-1, 0, 1]:
-                if di == 0 and dj == 0:
-                    continue
-                ni, nj = (i + di) % self.height, (j + dj) % self.width
-                neighbor_count += grid[ni, nj]
-
-        current_state = grid[i, j]
-
-        # Standard cellular automaton rules
-        if current_state == 1 and neighbor_count in [2, 3]:
-            return 1
-        elif current_state == 0 and neighbor_count == 3:
-            return 1
-        return 0
+        # Pattern analysis history: ring buffer of the most recent grids with
+        # their 64-bit hashes, written in place every step
+        self._history = np.zeros((5, height, width), dtype=np.int8)
+        self._history_hashes = [0] * 5
+        self._history_count = 0
 
     def apply_perturbation(self, base_state, math_value):
         """Apply mathematical perturbation to prevent pattern stagnation"""
-        threshold = math_value / 9.0
-        if threshold < self.perturbation_rate:
-            return 1 - base_state
-        return base_state
+        threshold = np.asarray(math_value) / 9.0
+        return np.where(threshold < self.perturbation_rate, 1 - base_state, base_state)
+
+    def _grid_hash(self):
+        """64-bit hash of the current grid"""
+        digest = hashlib.blake2b(self.grid.tobytes(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
 
-    def detect_pattern_stagnation(self):
+    def detect_pattern_stagnation(self, grid_hash=None):
         """Detect when patterns become static or repetitive"""
-        if len(self.pattern_history) < 3:
+        if self._history_count < 3:
             return False
 
-        current = self.grid
-        if len(self.pattern_history) >= 1 and np.array_equal(
-            current, self.pattern_history[-1]
-        ):
-            return True
-        if len(self.pattern_history) >= 2 and np.array_equal(
-            current, self.pattern_history[-2]
-        ):
-            return True
+        if grid_hash is None:
+            grid_hash = self._grid_hash()
+
+        # Identical to one of the last two grids means a static or 2-cycle state;
+        # the stored grid confirms a hash match
+        for back in (1, 2):
+            slot = (self._history_count - back) % len(self._history)
+            if self._history_hashes[slot] == grid_hash and np.array_equal(
+                self._history[slot], self.grid
+            ):
+                return True
 
         return False
 
     def evolve_step(self):
         """Execute one evolution step with mathematical perturbation"""
-        new_grid = np.zeros_like(self.grid)
         math_values = self.math_engine.next_values(8)
-        stagnation_detected = self.detect_pattern_stagnation()
-
-        for i in range(self.height):
-            for j in range(self.width):
-                base_next_state = self.apply_rules(i, j, self.grid)
-
-                if stagnation_detected:
-                    value_index = (i * self.width + j) % len(math_values)
-                    next_state = self.apply_perturbation(
-                        base_next_state, math_values[value_index]
-                    )
-                else:
-                    next_state = base_next_state
+        grid_hash = self._grid_hash()
+        stagnation_detected = self.detect_pattern_stagnation(grid_hash)
 
-                new_grid[i, j] = next_state
+        self._step(self.grid, self._new_grid)
+        if stagnation_detected:
+            # Cell k of the flattened grid is perturbed by math_values[k % 8]
+            math_grid = np.resize(math_values, self.grid.shape)
+            self._new_grid[:] = self.apply_perturbation(self._new_grid, math_grid)
 
         # Update state tracking
-        self.pattern_history.append(self.grid.copy())
-        if len(self.pattern_history) > 5:
-            self.pattern_history.pop(0)
+        slot = self._history_count % len(self._history)
+        np.copyto(self._history[slot], self.grid)
+        self._history_hashes[slot] = grid_hash
+        self._history_count += 1
 
-        self.grid = new_grid
+        self.grid, self._new_grid = self._new_grid, self.grid
         self.generation += 1
 
     def initialize_pattern(self):
@@ -144,34 +235,28 @@ class PatternEngine:
         math_values = self.math_engine.next_values(16)
 
         # Create seed points based on mathematical sequence
-        for i in range(0, len(math_values), 2):
-            x = (math_values[i] * 10 + math_values[i + 1]) % self.width
-            y = (math_values[i] * 7 + math_values[i + 1] * 3) % self.height
+        seed_index = np.arange(0, len(math_values), 2)[:, None, None]
+        x = (math_values[0::2] * 10 + math_values[1::2]) % self.width
+        y = (math_values[0::2] * 7 + math_values[1::2] * 3) % self.height
 
-            # Create clusters around seed points
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    nx, ny = (x + dx) % self.width, (y + dy) % self.height
-                    if math_values[(i + dx + dy) % len(math_values)] > 5:
-                        self.grid[ny, nx] = 1
+        # Create clusters around seed points
+        dx, dy = np.meshgrid([-1, 0, 1], [-1, 0, 1], indexing="ij")
+        nx = (x[:, None, None] + dx) % self.width
+        ny = (y[:, None, None] + dy) % self.height
+        active = math_values[(seed_index + dx + dy) % len(math_values)] > 5
+        self.grid[ny[active], nx[active]] = 1
 
     def convert_to_visual(self):
         """Convert pattern grid to visual ASCII representation"""
-        visual_lines = []
-
-        for row in self.grid:
-            line = ""
-            for cell in row:
-                if cell == 1:
-                    # Use mathematical values to select visual character
-                    math_val = self.math_engine.next_values(1)[0]
-                    char_index = min(math_val, len(self.visual_chars) - 1)
-                    line += self.visual_chars[char_index]
-                else:
-                    line += " "
-            visual_lines.append(line.rstrip())
-
-        return "\n".join(visual_lines)
+        live = self.grid == 1
+
+        # Use mathematical values to select visual characters, one per live cell
+        math_vals = self.math_engine.stream_values(int(np.count_nonzero(live)))
+
+        cells = np.full(self.grid.shape, " ", dtype="<U1")
+        cells[live] = self._char_lut[math_vals]
+
+        return "\n".join("".join(row).rstrip() for row in cells.tolist())
 
     def generate_pattern(self, evolution_steps=30):
         """Generate complete unique visual pattern"""
@@ -195,7 +280,7 @@ class AsciiArtGenerator:
         if steps is None:
             # Determine evolution steps using mathematical values
             math_vals = self.engine.math_engine.next_values(2)
-            steps = 20 + (math_vals[0] * math_vals[1]) % 40
+            steps = 20 + int(math_vals[0] * math_vals[1]) % 40
 
         artwork = self.engine.generate_pattern(steps)
         self.creation_count += 1
@@ -254,6 +339,9 @@ def main():
     """Interactive ASCII art generation"""
     generator = AsciiArtGenerator()
 
+    if os.name == "nt":
+        os.system("")  # Enable ANSI escape processing in the Windows console
+
     print("Non-Repeating ASCII Art Generator")
     print("Powered by advanced mathematical computation")
     print("\nPress Enter to generate art, 'q' to quit, 's' to save...")
@@ -268,7 +356,7 @@ def main():
             filename = generator.save_to_file()
             print(f"Art saved to {filename}")
         else:
-            print("\033c", end="")
+            sys.stdout.write(_CLEAR)
             generator.display()
 
 
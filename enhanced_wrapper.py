@@ -1,158 +1,318 @@
 #!/usr/bin/env python3
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import functools
+import weakref
+import numpy as np
 import time
 import os
+import mmap
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumpb(obj):
+    """Serialize obj to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _read_jsonl(path):
+    """Parse each record of a JSON Lines file from a read-only memory map"""
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [
+                _json_loads(line) for line in iter(mm.readline, b"") if line.strip()
+            ]
+
+
+def _append_runs(path, runs, max_runs):
+    """Append metrics records to a JSON Lines log in one write and clear them"""
+    if not runs:
+        return
+    with open(path, "a+b") as f:
+        # Count the log at write time, since other generators and processes
+        # may have appended to it since this one last did
+        f.seek(0)
+        logged = sum(1 for line in f if line.strip())
+        payload = b"".join(
+            _json_dumpb(run) + b"\n" for run in runs[: max(max_runs - logged, 0)]
+        )
+        f.write(payload)
+    runs.clear()
+
+
+(
+    _EMPTY,
+    _NEURON,
+    _DIAGONAL,
+    _CROSS,
+    _BRANCH,
+    _VERTICAL,
+    _T_UP,
+    _T_DOWN,
+    _HORIZONTAL,
+    _T_LEFT,
+    _T_RIGHT,
+) = range(11)
+
+_NEURON_SYMBOLS = ("◉", "●", "○", "◯", "⊙", "⊗")
+_PATHWAY_SYMBOLS = {
+    "horizontal": "━",
+    "vertical": "┃",
+    "cross": "╋",
+    "junction_t_up": "┻",
+    "junction_t_down": "┳",
+    "junction_t_left": "┫",
+    "junction_t_right": "┣",
+    "corner_tl": "┏",
+    "corner_tr": "┓",
+    "corner_bl": "┗",
+    "corner_br": "┛",
+    "branch": "┼",
+}
+# Symbol for each pattern code, indexed by the codes above
+_PATTERN_SYMBOLS = (
+    " ",
+    _NEURON_SYMBOLS[0],
+    _NEURON_SYMBOLS[1],
+    _PATHWAY_SYMBOLS["cross"],
+    _PATHWAY_SYMBOLS["branch"],
+    _PATHWAY_SYMBOLS["vertical"],
+    _PATHWAY_SYMBOLS["junction_t_up"],
+    _PATHWAY_SYMBOLS["junction_t_down"],
+    _PATHWAY_SYMBOLS["horizontal"],
+    _PATHWAY_SYMBOLS["junction_t_left"],
+    _PATHWAY_SYMBOLS["junction_t_right"],
+)
+
+# Neighbour offsets in (ul, up, ur, left, right, dl, down, dr) order
+_OFFSETS8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _pattern_code(ul, up, ur, left, right, dl, down, dr):
+    """Classify an active cell from its 8 neighbours into a pattern code"""
+    active_count = ul + up + ur + left + right + dl + down + dr
+
+    if active_count == 0:
+        return _NEURON
+
+    has_vertical = up or down
+    has_horizontal = left or right
+
+    if has_vertical and has_horizontal:
+        return _CROSS if active_count >= 4 else _BRANCH
+    elif has_vertical:
+        if up and down:
+            return _VERTICAL
+        return _T_UP if up else _T_DOWN
+    elif has_horizontal:
+        if left and right:
+            return _HORIZONTAL
+        return _T_LEFT if left else _T_RIGHT
+    # Only diagonal neighbours remain
+    return _DIAGONAL if active_count == 1 else _BRANCH
+
+
+# Pattern code for every packed (ul, up, ur, left, right, dl, down, dr) byte,
+# built once at import and shared by all renderers
+_PATTERN_LUT = np.array(
+    [
+        _pattern_code(*((key >> shift) & 1 for shift in range(7, -1, -1)))
+        for key in range(256)
+    ],
+    dtype=np.uint8,
+)
+_PATTERN_LUT.flags.writeable = False
+
+# Cursor home plus erase display: redraws in place without a terminal reset
+_CLEAR = "\033[H\033[2J"
+
+# Metrics records are held in memory and appended this many at a time
+_METRICS_BATCH_SIZE = 4
+
+
+# Main menu, printed in one call on every loop
+_MENU = (
+    "\nOptions:\n"
+    "  [Enter] - Generate neural pathway art\n"
+    "  'live' - Watch live neural evolution\n"
+    "  'live 5' - Watch 5 generations\n"
+    "  'fast' - Fast animation (0.2s delay)\n"
+    "  'slow' - Slow animation (1.0s delay)\n"
+    "  's' - Save neural art to file\n"
+    "  'v' - View metrics log\n"
+    "  'test' - Test neural renderer\n"
+    "  'q' - Quit\n"
+)
+
 
 class NeuralPathwayRenderer:
-    def __init__(self):
-        self.neuron_symbols = ["◉", "●", "○", "◯", "⊙", "⊗"]
-        self.pathway_symbols = {
-            "horizontal": "━",
-            "vertical": "┃",
-            "cross": "╋",
-            "junction_t_up": "┻",
-            "junction_t_down": "┳",
-            "junction_t_left": "┫",
-            "junction_t_right": "┣",
-            "corner_tl": "┏",
-            "corner_tr": "┓",
-            "corner_bl": "┗",
-            "corner_br": "┛",
-            "branch": "┼",
-        }
+    neuron_symbols = _NEURON_SYMBOLS
+    pathway_symbols = _PATHWAY_SYMBOLS
+    pattern_symbols = _PATTERN_SYMBOLS
+    pattern_lut = _PATTERN_LUT
 
     def analyze_8_neighborhood(self, grid, i, j):
-        height, width = len(grid), len(grid[0])
-        neighbors = []
-        positions = [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]
-
-        for di, dj in positions:
-            ni, nj = i + di, j + dj
-            if 0 <= ni < height and 0 <= nj < width:
-                neighbors.append(grid[ni][nj])
-            else:
-                neighbors.append(0)
-
-        return neighbors
+        grid = np.asarray(grid, dtype=np.uint8)
+        height, width = grid.shape
+        return tuple(
+            (
+                int(grid[i + di, j + dj])
+                if 0 <= i + di < height and 0 <= j + dj < width
+                else 0
+            )
+            for di, dj in _OFFSETS8
+        )
 
     def get_connection_pattern(self, grid, i, j):
-        if grid[i][j] == 0:
+        grid = np.asarray(grid, dtype=np.uint8)
+        if grid[i, j] == 0:
             return " "
 
-        neighbors = self.analyze_8_neighborhood(grid, i, j)
-
-        up, down = neighbors[1], neighbors[6]
-        left, right = neighbors[3], neighbors[4]
-        ul, ur = neighbors[0], neighbors[2]
-        dl, dr = neighbors[5], neighbors[7]
+        key = 0
+        for bit in self.analyze_8_neighborhood(grid, i, j):
+            key = (key << 1) | bit
+        return self.pattern_symbols[self.pattern_lut[key]]
 
-        active_count = sum(neighbors)
+    def classify_grid(self, grid):
+        grid = np.asarray(grid, dtype=np.uint8)
+        padded = np.pad(grid, 1)
 
-        if active_count == 0:
-            return self.neuron_symbols[0]
+        # Each padded row's 3-cell horizontal window, packed once as 3 bits and
+        # shared as the top row of the cells below and the bottom row of those above
+        triples = (padded[:, :-2] << 2) | (padded[:, 1:-1] << 1) | padded[:, 2:]
+        left, right = padded[1:-1, :-2], padded[1:-1, 2:]
 
-        has_vertical = up or down
-        has_horizontal = left or right
-        has_diagonal = ul or ur or dl or dr
-
-        if has_vertical and has_horizontal:
-            if active_count >= 4:
-                return self.pathway_symbols["cross"]
-            else:
-                return self.pathway_symbols["branch"]
-        elif has_vertical:
-            if up and down:
-                return self.pathway_symbols["vertical"]
-            elif up:
-                return self.pathway_symbols["junction_t_up"]
-            else:
-                return self.pathway_symbols["junction_t_down"]
-        elif has_horizontal:
-            if left and right:
-                return self.pathway_symbols["horizontal"]
-            elif left:
-                return self.pathway_symbols["junction_t_left"]
-            else:
-                return self.pathway_symbols["junction_t_right"]
-        elif has_diagonal:
-            if active_count == 1:
-                return self.neuron_symbols[1]
-            else:
-                return self.pathway_symbols["branch"]
-        else:
-            symbol_index = min(active_count - 1, len(self.neuron_symbols) - 1)
-            return self.neuron_symbols[symbol_index]
+        # Pack the neighbours into a byte and classify through the lookup table
+        key = (triples[:-2] << 5) | (left << 4) | (right << 3) | triples[2:]
+        return np.where(grid != 0, self.pattern_lut[key], _EMPTY).astype(np.uint8)
 
     def render_neural_grid(self, grid):
+        return self._render_codes(self.classify_grid(grid))
+
+    def _render_codes(self, codes):
+        symbols = self.pattern_symbols
         neural_lines = []
-        for i, row in enumerate(grid):
-            line = ""
-            for j, cell in enumerate(row):
-                symbol = self.get_connection_pattern(grid, i, j)
-                line += symbol
+        for row_codes in codes.tolist():
+            line = "".join([symbols[code] for code in row_codes])
             neural_lines.append(line.rstrip())
         return "\n".join(neural_lines)
 
     def analyze_network_properties(self, grid):
-        height, width = len(grid), len(grid[0])
-        total_cells = height * width
-        active_cells = sum(sum(row) for row in grid)
+        grid = np.asarray(grid, dtype=np.uint8)
+        return self._network_properties(grid, np.flatnonzero(grid))
+
+    def analyze_and_render(self, grid):
+        grid = np.asarray(grid, dtype=np.uint8)
+        codes = self.classify_grid(grid)
+        # _EMPTY is 0, so the non-zero codes are exactly the active cells
+        active = np.flatnonzero(codes)
+        return self._render_codes(codes), self._network_properties(grid, active)
+
+    def _network_properties(self, grid, active):
+        total_cells = grid.size
+        active_cells = int(active.size)
 
-        clusters = self.find_connected_components(grid)
-        largest_cluster = max(len(cluster) for cluster in clusters) if clusters else 0
+        sizes = self.cluster_sizes(grid, active)
+        cluster_count = int(sizes.size)
+        largest_cluster = int(sizes.max(initial=0))
 
         return {
             "active_ratio": active_cells / total_cells,
-            "cluster_count": len(clusters),
+            "cluster_count": cluster_count,
             "largest_cluster": largest_cluster,
             "network_density": active_cells / total_cells,
-            "fragmentation": len(clusters) / max(1, active_cells),
+            "fragmentation": cluster_count / max(1, active_cells),
         }
 
-    def find_connected_components(self, grid):
-        height, width = len(grid), len(grid[0])
-        visited = [[False] * width for _ in range(height)]
-        components = []
-
-        def dfs(i, j, component):
-            if (
-                i < 0
-                or i >= height
-                or j < 0
-                or j >= width
-                or visited[i][j]
-                or grid[i][j] == 0
-            ):
-                return
-
-            visited[i][j] = True
-            component.append((i, j))
-
-            for di in [-1, 0, 1]:
-                for dj in [-1, 0, 1]:
-                    if di != 0 or dj != 0:
-                        dfs(i + di, j + dj, component)
-
+    def _label_components(self, grid, active=None):
+        height, width = grid.shape
+        if active is None:
+            active = np.flatnonzero(grid)
+
+        # Fast paths: an empty or full grid has no or one cluster, and on a
+        # single row or column each cluster is a run of consecutive cells
+        if active.size == 0 or active.size == grid.size:
+            return active, np.zeros(active.size, dtype=np.intp)
+        if height == 1 or width == 1:
+            run_start = np.diff(active, prepend=-2) != 1
+            return active, np.maximum.accumulate(np.where(run_start, active, 0))
+
+        flat = grid.ravel().tolist()
+        parent = list(range(height * width))
+
+        def find(x):
+            # Path halving keeps the trees flat without recursion
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        def union(a, b):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                # The smaller index wins, so a root is its component's first cell
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        # First pass: link each active cell to its already scanned neighbours
+        # (W, NW, N, NE) in row-major order
         for i in range(height):
             for j in range(width):
-                if grid[i][j] == 1 and not visited[i][j]:
-                    component = []
-                    dfs(i, j, component)
-                    if component:
-                        components.append(component)
+                k = i * width + j
+                if not flat[k]:
+                    continue
+                if j > 0 and flat[k - 1]:
+                    union(k, k - 1)
+                if i > 0:
+                    above = k - width
+                    if j > 0 and flat[above - 1]:
+                        union(k, above - 1)
+                    if flat[above]:
+                        union(k, above)
+                    if j < width - 1 and flat[above + 1]:
+                        union(k, above + 1)
+
+        # Second pass: resolve every active cell to its root
+        roots = np.array([find(k) for k in active.tolist()], dtype=np.intp)
+        return active, roots
+
+    def cluster_sizes(self, grid, active=None):
+        grid = np.asarray(grid, dtype=np.uint8)
+        _, roots = self._label_components(grid, active)
+        sizes = np.bincount(roots)
+        return sizes[sizes > 0].astype(np.int32)
+
+    def find_connected_components(self, grid):
+        grid = np.asarray(grid, dtype=np.uint8)
+        width = grid.shape[1]
+        active, roots = self._label_components(grid)
+        if active.size == 0:
+            return []
+
+        order = np.argsort(roots, kind="stable")
+        boundaries = np.flatnonzero(np.diff(roots[order])) + 1
 
+        components = []
+        for members in np.split(active[order], boundaries):
+            rows, cols = np.divmod(members, width)
+            components.append(list(zip(rows.tolist(), cols.tolist())))
         return components
 
 
@@ -161,8 +321,27 @@ class AsciiArtGenerator:
         self.api_url = "https://ascii-art-api-e3rw.onrender.com"
         self.session_count = 0
         self.max_sessions = 11
-        self.metrics_file = "mathematical_metrics_log.txt"
+        self.metrics_file = "mathematical_metrics_log.jsonl"
         self.renderer = NeuralPathwayRenderer()
+        # Stationary frames repeat the same art, so reuse their render
+        self._render_art = functools.lru_cache(maxsize=32)(self._render_art_uncached)
+        # Keep-alive session so repeated calls reuse the API connection
+        self._http = requests.Session()
+        self._http.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        # Pending metrics records, written in batches and on exit
+        self._pending_runs = []
+        # Holds the path and list rather than self, so pending records are
+        # written when the generator is collected or at interpreter exit
+        weakref.finalize(
+            self,
+            _append_runs,
+            self.metrics_file,
+            self._pending_runs,
+            self.max_sessions,
+        )
 
     def create(self, steps=None):
         if self.session_count >= self.max_sessions:
@@ -173,12 +352,12 @@ class AsciiArtGenerator:
 
         try:
             payload = {"steps": steps} if steps else {}
-            response = requests.post(
+            response = self._http.post(
                 f"{self.api_url}/generate", json=payload, timeout=30
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = _json_loads(response.content)
             self.session_count += 1
 
             self._save_metrics_to_file(result, "static")
@@ -187,31 +366,33 @@ class AsciiArtGenerator:
         except Exception as e:
             return {"art": f"API unavailable: {e}", "status": "error"}
 
+    def _render(self, result):
+        return self._render_art(result.get("art", ""))
+
+    def _render_art_uncached(self, art_string):
+        grid = self._convert_art_to_grid(art_string)
+        return self.renderer.analyze_and_render(grid)
+
     def _convert_art_to_grid(self, art_string):
         lines = art_string.strip().split("\n")
         max_width = max(len(line) for line in lines) if lines else 0
 
-        grid = []
-        for line in lines:
-            row = []
-            padded_line = line.ljust(max_width)
-            for char in padded_line:
-                row.append(1 if char != " " else 0)
-            grid.append(row)
-
-        return grid
+        # One fixed-width UTF-32 code point per cell, compared in a single pass
+        padded = "".join(line.ljust(max_width) for line in lines)
+        codepoints = np.frombuffer(padded.encode("utf-32-le"), dtype="<u4")
+        return (codepoints != 0x20).astype(np.uint8).reshape(len(lines), max_width)
 
     def display(self, show_info=True, show_metrics=True):
         result = self.create()
 
         if result.get("status") == "error":
             print(result.get("art", "Generation failed"))
-            return
+            return result
 
         if result.get("status") == "limit_reached":
             print(result.get("art"))
             print(f"Metrics saved to: {self.metrics_file}")
-            return
+            return result
 
         if show_info and result.get("status") != "error":
             print(f"\nNeural Pathway ASCII Art Generator")
@@ -222,9 +403,7 @@ class AsciiArtGenerator:
             print("=" * 80)
 
         original_art = result.get("art", "")
-        grid = self._convert_art_to_grid(original_art)
-        neural_art = self.renderer.render_neural_grid(grid)
-        network_props = self.renderer.analyze_network_properties(grid)
+        neural_art, network_props = self._render(result)
 
         print("ORIGINAL ASCII:")
         print(original_art)
@@ -247,6 +426,8 @@ class AsciiArtGenerator:
                 f"Session {self.session_count}/{self.max_sessions} | Metrics logged to {self.metrics_file}"
             )
 
+        return result
+
     def _display_mathematical_metrics(self, metrics, breakdowns, network_props):
         print("\n┌─────────────────────────────────────────┐")
         print("│         MATHEMATICAL METRICS            │")
@@ -313,8 +494,10 @@ class AsciiArtGenerator:
             print("│    Sparse, isolated neural clusters")
         print("└─────────────────────────────────────────")
 
-    def save_to_file(self, filename=None):
-        result = self.create()
+    def save_to_file(self, filename=None, result=None):
+        # Save an already fetched result rather than spending another session
+        if result is None:
+            result = self.create()
         if result.get("status") in ["error", "limit_reached"]:
             return None
 
@@ -323,9 +506,7 @@ class AsciiArtGenerator:
             filename = f"neural_pathway_art_{timestamp}.txt"
 
         original_art = result.get("art", "")
-        grid = self._convert_art_to_grid(original_art)
-        neural_art = self.renderer.render_neural_grid(grid)
-        network_props = self.renderer.analyze_network_properties(grid)
+        neural_art, network_props = self._render(result)
 
         with open(filename, "w") as f:
             f.write("Neural Pathway ASCII Art Generator\n")
@@ -349,18 +530,12 @@ class AsciiArtGenerator:
 
     def _save_metrics_to_file(self, result, run_type):
         try:
-            try:
-                with open(self.metrics_file, "r") as f:
-                    existing_data = json.loads(f.read())
-            except (FileNotFoundError, json.JSONDecodeError):
-                existing_data = {"runs": [], "total_sessions": 0}
-
-            if len(existing_data["runs"]) >= self.max_sessions:
+            # One JSON record per line, so a save appends instead of rewriting.
+            # Each flush trims its batch against the log's current length.
+            if len(self._pending_runs) >= self.max_sessions:
                 return
 
-            original_art = result.get("art", "")
-            grid = self._convert_art_to_grid(original_art)
-            network_props = self.renderer.analyze_network_properties(grid)
+            _, network_props = self._render_art(result.get("art", ""))
 
             run_data = {
                 "session_id": self.session_count,
@@ -373,12 +548,20 @@ class AsciiArtGenerator:
                 ),
             }
 
-            existing_data["runs"].append(run_data)
-            existing_data["total_sessions"] = len(existing_data["runs"])
+            self._pending_runs.append(run_data)
+            if len(self._pending_runs) >= _METRICS_BATCH_SIZE:
+                self.flush_metrics()
 
-            with open(self.metrics_file, "w") as f:
-                json.dump(existing_data, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save metrics to file: {e}")
+
+    def flush_metrics(self):
+        """Append pending metrics records to the log in a single write"""
+        if not self._pending_runs:
+            return
 
+        try:
+            _append_runs(self.metrics_file, self._pending_runs, self.max_sessions)
         except Exception as e:
             print(f"Warning: Could not save metrics to file: {e}")
 
@@ -390,19 +573,19 @@ class AsciiArtGenerator:
 
         try:
             payload = {"max_generations": min(max_generations or 11, 11)}
-            response = requests.post(
+            response = self._http.post(
                 f"{self.api_url}/animate", json=payload, timeout=120
             )
 
             if response.status_code == 429:
-                rate_info = response.json()
+                rate_info = _json_loads(response.content)
                 print("Daily animation limit reached (11 generations)")
                 print(f"Limit resets: {rate_info.get('limit_reset', 'in 24 hours')}")
                 print("Showing single generation instead:")
                 return self.display()
 
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             self.session_count += 1
 
             if "frames" in data and data["frames"]:
@@ -421,8 +604,11 @@ class AsciiArtGenerator:
             )
             print(f"Delay: {delay}s transitions | Press Ctrl+C to stop\n")
 
+            # Frames run on a fixed schedule, so render time comes out of
+            # the delay instead of adding to it
+            next_deadline = time.monotonic()
             for i, frame in enumerate(data.get("frames", [])):
-                print("\033c", end="")
+                print(_CLEAR, end="")
 
                 print("Live Neural Pathway Evolution")
                 print(
@@ -432,9 +618,7 @@ class AsciiArtGenerator:
 
                 original_art = frame.get("art", "")
                 if original_art:
-                    grid = self._convert_art_to_grid(original_art)
-                    neural_art = self.renderer.render_neural_grid(grid)
-                    network_props = self.renderer.analyze_network_properties(grid)
+                    neural_art, network_props = self._render_art(original_art)
 
                     print("NEURAL PATHWAYS:")
                     print(neural_art)
@@ -451,7 +635,13 @@ class AsciiArtGenerator:
                 print("Neural network evolution in progress...")
 
                 if i < len(data["frames"]) - 1:
-                    time.sleep(delay)
+                    next_deadline += delay
+                    sleep_time = next_deadline - time.monotonic()
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
+                    elif sleep_time < -delay:
+                        # Too far behind: restart the schedule, don't rush frames
+                        next_deadline = time.monotonic()
 
             print(
                 f"\nAnimation complete! Session {self.session_count}/{self.max_sessions}"
@@ -462,10 +652,7 @@ class AsciiArtGenerator:
                 final_frame = data["frames"][-1]
                 final_art = final_frame.get("art", "")
                 if final_art:
-                    final_grid = self._convert_art_to_grid(final_art)
-                    final_network_props = self.renderer.analyze_network_properties(
-                        final_grid
-                    )
+                    _, final_network_props = self._render_art(final_art)
                     print("\nFinal Neural Network State:")
                     self._display_mathematical_metrics(
                         final_frame["metrics"],
@@ -491,14 +678,14 @@ class AsciiArtGenerator:
         }
 
     def view_metrics_log(self):
+        self.flush_metrics()
         try:
-            with open(self.metrics_file, "r") as f:
-                data = json.loads(f.read())
+            runs = _read_jsonl(self.metrics_file)
 
             print(
-                f"\n=== NEURAL PATHWAY METRICS LOG ({data['total_sessions']}/{self.max_sessions} sessions) ==="
+                f"\n=== NEURAL PATHWAY METRICS LOG ({len(runs)}/{self.max_sessions} sessions) ==="
             )
-            for run in data["runs"]:
+            for run in runs:
                 print(
                     f"\nSession {run['session_id']} ({run['type']}) - {run['timestamp']}"
                 )
@@ -524,15 +711,14 @@ def test_neural_renderer():
     network_props = renderer.analyze_network_properties(test_grid)
 
     print("Test Grid:")
-    for row in test_grid:
-        print(" ".join(str(cell) for cell in row))
+    cells = np.asarray(test_grid).astype(str).tolist()
+    print("\n".join(" ".join(row) for row in cells))
 
     print("\nNeural Visualization:")
     print(neural_output)
 
     print("\nNetwork Properties:")
-    for key, value in network_props.items():
-        print(f"  {key}: {value}")
+    print("\n".join(f"  {key}: {value}" for key, value in network_props.items()))
 
     print("Neural renderer test complete.")
     return True
@@ -540,6 +726,7 @@ def test_neural_renderer():
 
 def main():
     gen = AsciiArtGenerator()
+    last_result = None
 
     print("Neural Pathway ASCII Art Generator")
     print("Powered by mathematical cellular automaton with 8-neighborhood connectivity")
@@ -558,16 +745,7 @@ def main():
                 gen.view_metrics_log()
             break
 
-        print("\nOptions:")
-        print("  [Enter] - Generate neural pathway art")
-        print("  'live' - Watch live neural evolution")
-        print("  'live 5' - Watch 5 generations")
-        print("  'fast' - Fast animation (0.2s delay)")
-        print("  'slow' - Slow animation (1.0s delay)")
-        print("  's' - Save neural art to file")
-        print("  'v' - View metrics log")
-        print("  'test' - Test neural renderer")
-        print("  'q' - Quit")
+        print(_MENU, end="")
 
         user_input = input("\n> ").strip().lower()
 
@@ -581,7 +759,7 @@ def main():
                 print(f"Metrics saved to: {status['metrics_file']}")
             break
         elif user_input == "s":
-            filename = gen.save_to_file()
+            filename = gen.save_to_file(result=last_result)
             if filename:
                 print(f"Neural pathway art saved to {filename}")
         elif user_input == "v":
@@ -600,8 +778,8 @@ def main():
         elif user_input == "slow":
             gen.animate(delay=1.0)
         else:
-            print("\033c", end="")
-            gen.display()
+            print(_CLEAR, end="")
+            last_result = gen.display()
 
 
 if __name__ == "__main__":
@@ -1,66 +1,214 @@
 #!/usr/bin/env python3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import os
+import mmap
 import sys
 import math
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumpb(obj):
+    """Serialize obj to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _read_jsonl(path):
+    """Parse each record of a JSON Lines file from a read-only memory map"""
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [
+                _json_loads(line) for line in iter(mm.readline, b"") if line.strip()
+            ]
+
+
+def _append_runs(path, runs, max_runs):
+    """Append metrics records to a JSON Lines log in one write and clear them"""
+    if not runs:
+        return
+    with open(path, "a+b") as f:
+        # Count the log at write time, since other generators and processes
+        # may have appended to it since this one last did
+        f.seek(0)
+        logged = sum(1 for line in f if line.strip())
+        payload = b"".join(
+            _json_dumpb(run) + b"\n" for run in runs[: max(max_runs - logged, 0)]
+        )
+        f.write(payload)
+    runs.clear()
+
+
+# 8-neighborhood offsets, clockwise from top-left
+_NEIGHBOR_OFFSETS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+# Maps the characters treated as empty space to NUL (and a literal NUL away
+# from it), so a single translate leaves NUL exactly on the blank cells
+_BLANK_TO_NUL = str.maketrans({" ": "\0", "\t": "\0", "\n": "\0", "\0": "\x01"})
+
+
+def _visible_mask(lines, width):
+    """Mark the cells of width-padded lines that hold a visible character"""
+    padded = "".join(line[:width].ljust(width) for line in lines)
+    padded = padded.translate(_BLANK_TO_NUL).encode("utf-32-le")
+    codepoints = np.frombuffer(padded, dtype="<u4")
+    return (codepoints != 0).reshape(len(lines), width)
+
+
+# Junction symbols are only valid with at least 3 connected neighbors
+_JUNCTION_SYMBOLS = frozenset("┳┻┣┫╋┼")
+
+# 256-color prefixes for low, medium and high density: deep blue, orange, red
+_COLOR_PREFIXES = ("\033[38;5;21m", "\033[38;5;202m", "\033[38;5;196m")
+_COLOR_RESET = "\033[0m"
+
+# Cursor home plus erase display, written before each animation frame
+_CLEAR = "\033[H\033[2J"
+
+# Metrics records are held in memory and appended this many at a time
+_METRICS_BATCH_SIZE = 4
+
+
+# Main menu, printed in one call on every loop
+_MENU = (
+    "\nOptions:\n"
+    "  [Enter] - Generate enhanced neural pathway art\n"
+    "  'live' - Watch live neural evolution\n"
+    "  'live 5' - Watch 5 generations\n"
+    "  'fast' - Fast animation (0.2s delay)\n"
+    "  'slow' - Slow animation (1.0s delay)\n"
+    "  's' - Save neural art to file\n"
+    "  'v' - View metrics log\n"
+    "  'test' - Test neural renderer\n"
+    "  'testall' - Run comprehensive tests\n"
+    "  'grid' - Test grid conversion\n"
+    "  'validate' - Test validation checkpoints\n"
+    "  'q' - Quit\n"
+)
+
+
+def _build_symbol_lookup_table():
+    """8-bit neighborhood binary vector to symbol mapping"""
+    lookup = {}
+
+    # 8-bit encoding: [TL, T, TR, L, R, BL, B, BR] clockwise from top-left
+    # Basic patterns
+    lookup[0b00000000] = " "  # Empty
+
+    # Horizontal lines
+    lookup[0b00010100] = "━"  # Left-Right
+    lookup[0b00000100] = "╸"  # Right only
+    lookup[0b00010000] = "╺"  # Left only
+
+    # Vertical lines
+    lookup[0b01000010] = "┃"  # Up-Down
+    lookup[0b01000000] = "╹"  # Up only
+    lookup[0b00000010] = "╻"  # Down only
+
+    # T-junctions (3 connections)
+    lookup[0b01010100] = "┳"  # T pointing down
+    lookup[0b00010110] = "┻"  # T pointing up
+    lookup[0b01010010] = "┣"  # T pointing right
+    lookup[0b01000110] = "┫"  # T pointing left
+
+    # Cross junction (4+ connections)
+    lookup[0b01010110] = "╋"  # Full cross
+
+    # Corners (2 connections at 90 degrees)
+    lookup[0b00010010] = "┏"  # Top-left corner
+    lookup[0b01000100] = "┓"  # Top-right corner
+    lookup[0b00000110] = "┗"  # Bottom-left corner
+    lookup[0b01010000] = "┛"  # Bottom-right corner
+
+    # Default fallback for any unmatched pattern
+    for i in range(256):
+        if i not in lookup:
+            bit_count = bin(i).count("1")
+            if bit_count >= 3:
+                lookup[i] = "┼"  # Generic junction
+            elif bit_count == 2:
+                lookup[i] = "━"  # Generic connection
+            elif bit_count == 1:
+                lookup[i] = "●"  # Single neuron
+            else:
+                lookup[i] = " "  # Empty
+
+    return lookup
+
+
+# Symbol for every 8-bit neighborhood code, built once at import and shared
+# by all renderers
+_SYMBOL_LOOKUP = _build_symbol_lookup_table()
+_BITCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+_BITCOUNT.flags.writeable = False
+# Junction validity depends only on the code, so it is checked here once
+# instead of on every rendered cell
+_SYMBOL_ARRAY = np.array(
+    [
+        "●" if symbol in _JUNCTION_SYMBOLS and count < 3 else symbol
+        for symbol, count in zip(
+            (_SYMBOL_LOOKUP[i] for i in range(256)), _BITCOUNT.tolist()
+        )
+    ],
+    dtype="<U1",
+)
+_SYMBOL_ARRAY.flags.writeable = False
+# The same symbols as UTF-32 code points, for decoding a frame in one call
+_SYMBOL_CODEPOINTS = _SYMBOL_ARRAY.view(np.uint32)
+
 
 class NeuralPathwayRenderer:
     def __init__(self):
-        self.symbol_lookup = self._build_symbol_lookup_table()
+        self.symbol_lookup = _SYMBOL_LOOKUP
+        self.symbol_table = _SYMBOL_ARRAY
+        self.bitcount = _BITCOUNT
         self.color_support = self._detect_color_support()
-
-    def _build_symbol_lookup_table(self):
-        """8-bit neighborhood binary vector to symbol mapping"""
-        lookup = {}
-
-        # 8-bit encoding: [TL, T, TR, L, R, BL, B, BR] clockwise from top-left
-        # Basic patterns
-        lookup[0b00000000] = " "  # Empty
-        lookup[0b00010000] = "◉"  # Single cell
-
-        # Horizontal lines
-        lookup[0b00010100] = "━"  # Left-Right
-        lookup[0b00000100] = "╸"  # Right only
-        lookup[0b00010000] = "╺"  # Left only
-
-        # Vertical lines
-        lookup[0b01000010] = "┃"  # Up-Down
-        lookup[0b01000000] = "╹"  # Up only
-        lookup[0b00000010] = "╻"  # Down only
-
-        # T-junctions (3 connections)
-        lookup[0b01010100] = "┳"  # T pointing down
-        lookup[0b00010110] = "┻"  # T pointing up
-        lookup[0b01010010] = "┣"  # T pointing right
-        lookup[0b01000110] = "┫"  # T pointing left
-
-        # Cross junction (4+ connections)
-        lookup[0b01010110] = "╋"  # Full cross
-
-        # Corners (2 connections at 90 degrees)
-        lookup[0b00010010] = "┏"  # Top-left corner
-        lookup[0b01000100] = "┓"  # Top-right corner
-        lookup[0b00000110] = "┗"  # Bottom-left corner
-        lookup[0b01010000] = "┛"  # Bottom-right corner
-
-        # Default fallback for any unmatched pattern
-        for i in range(256):
-            if i not in lookup:
-                bit_count = bin(i).count("1")
-                if bit_count >= 3:
-                    lookup[i] = "┼"  # Generic junction
-                elif bit_count == 2:
-                    lookup[i] = "━"  # Generic connection
-                elif bit_count == 1:
-                    lookup[i] = "●"  # Single neuron
-                else:
-                    lookup[i] = " "  # Empty
-
-        return lookup
+        if self.color_support in ["256color", "truecolor"]:
+            self.color_prefixes = _COLOR_PREFIXES
+            self.color_suffix = _COLOR_RESET
+        else:
+            self.color_prefixes = ("", "", "")
+            self.color_suffix = ""
+        # Symbol, junction check and density color all follow from the code,
+        # so rendering a cell is a single lookup into this table
+        self.cell_table = np.array(
+            [
+                self._apply_color_coding(symbol, count / 8.0)
+                for symbol, count in zip(self.symbol_table.tolist(), self.bitcount)
+            ]
+        )
 
     def _detect_color_support(self):
         """Detect terminal color capabilities"""
@@ -76,190 +224,154 @@ class NeuralPathwayRenderer:
         else:
             return "none"
 
-    def _get_8bit_neighborhood_vector(self, grid, i, j):
-        """Extract 8-bit binary vector from 8-neighborhood"""
-        height, width = len(grid), len(grid[0])
-        positions = [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]
-
-        vector = 0
-        for idx, (di, dj) in enumerate(positions):
-            ni, nj = i + di, j + dj
-            if 0 <= ni < height and 0 <= nj < width and grid[ni][nj] == 1:
-                vector |= 1 << (7 - idx)
+    def _neighborhood_codes(self, grid):
+        """Encode every cell's 8-neighborhood as an 8-bit vector"""
+        grid = np.asarray(grid, dtype=np.uint8)
+        height, width = grid.shape
+        padded = np.pad(grid, 1)
 
-        return vector
+        # Bit 7 is the top-left neighbor, bit 0 the bottom-right
+        codes = np.zeros_like(grid)
+        for idx, (di, dj) in enumerate(_NEIGHBOR_OFFSETS):
+            rows = slice(1 + di, 1 + di + height)
+            cols = slice(1 + dj, 1 + dj + width)
+            shifted = padded[rows, cols]
+            codes |= (shifted == 1).astype(np.uint8) << (7 - idx)
 
-    def _apply_morphological_enhancement(self, grid):
+        return codes
+
+    def _apply_morphological_enhancement(self, grid, active_cells=None):
         """Apply dilation to enhance sparse regions"""
-        height, width = len(grid), len(grid[0])
-        enhanced = [[0] * width for _ in range(height)]
+        grid = np.asarray(grid, dtype=np.uint8)
+        height, width = grid.shape
 
         # Calculate density
-        total_cells = height * width
-        active_cells = sum(sum(row) for row in grid)
-        density = active_cells / total_cells
+        if active_cells is None:
+            active_cells = np.count_nonzero(grid)
+        density = active_cells / grid.size
 
         if density < 0.12:
-            # Apply dilation to sparse grids
-            for i in range(height):
-                for j in range(width):
-                    if grid[i][j] == 1:
-                        enhanced[i][j] = 1
-                        # Dilate to immediate neighbors
-                        for di in [-1, 0, 1]:
-                            for dj in [-1, 0, 1]:
-                                ni, nj = i + di, j + dj
-                                if 0 <= ni < height and 0 <= nj < width:
-                                    enhanced[ni][nj] = 1
-            return enhanced
+            # Dilate sparse grids: the 3x3 OR is separable into a row pass
+            # followed by a column pass
+            padded = np.pad(grid, 1)
+            rows = padded[:, :-2] | padded[:, 1:-1] | padded[:, 2:]
+            return rows[:-2] | rows[1:-1] | rows[2:]
 
         return grid
 
-    def _validate_junction_connectivity(self, grid, i, j, symbol):
-        """Validate that junction symbols have proper connectivity"""
-        junction_symbols = {"┳", "┻", "┣", "┫", "╋", "┼"}
-
-        if symbol not in junction_symbols:
-            return True
-
-        # Count actual connected neighbors
-        neighbors = self.analyze_8_neighborhood(grid, i, j)
-        connection_count = sum(neighbors)
-
-        # Junction symbols require at least 3 connections
-        return connection_count >= 3
-
     def analyze_8_neighborhood(self, grid, i, j):
         """Get 8-neighborhood values"""
-        height, width = len(grid), len(grid[0])
+        grid = np.asarray(grid, dtype=np.uint8)
+        height, width = grid.shape
         neighbors = []
-        positions = [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]
-
-        for di, dj in positions:
+
+        for di, dj in _NEIGHBOR_OFFSETS:
             ni, nj = i + di, j + dj
             if 0 <= ni < height and 0 <= nj < width:
-                neighbors.append(grid[ni][nj])
+                neighbors.append(int(grid[ni, nj]))
             else:
                 neighbors.append(0)
 
         return neighbors
 
-    def _trace_pathways(self, grid):
-        """Trace continuous pathways using DFS"""
-        height, width = len(grid), len(grid[0])
-        visited = [[False] * width for _ in range(height)]
-        pathways = []
-
-        def dfs(i, j, path):
-            if (
-                i < 0
-                or i >= height
-                or j < 0
-                or j >= width
-                or visited[i][j]
-                or grid[i][j] == 0
-            ):
-                return
+    def _label_clusters(self, grid):
+        """Label 8-connected clusters 1..n in raster order, 0 for background"""
+        grid = np.asarray(grid, dtype=np.uint8)
+        active = grid == 1
+
+        # Horizontal runs of active cells are connected already, so only
+        # runs need merging; number them in raster order
+        run_start = active.copy()
+        run_start[:, 1:] &= ~active[:, :-1]
+        run_ids = np.cumsum(run_start.ravel()).reshape(grid.shape) - 1
+        run_count = int(run_ids.size and run_ids[-1, -1] + 1)
+
+        # Pair every run with the runs it touches in the row above through
+        # a NW, N or NE neighbor; duplicate pairs collapse to one merge
+        below, above = active[1:], active[:-1]
+        pairs = []
+        for dj in (-1, 0, 1):
+            lo, hi = max(0, -dj), grid.shape[1] - max(0, dj)
+            cols, above_cols = slice(lo, hi), slice(lo + dj, hi + dj)
+            touching = below[:, cols] & above[:, above_cols]
+            pairs.append(
+                run_ids[1:, cols][touching] * run_count
+                + run_ids[:-1, above_cols][touching]
+            )
+        pairs = np.unique(np.concatenate(pairs))
 
-            visited[i][j] = True
-            path.append((i, j))
+        parent = list(range(run_count))
 
-            # Continue DFS in 8 directions
-            for di in [-1, 0, 1]:
-                for dj in [-1, 0, 1]:
-                    if di != 0 or dj != 0:
-                        dfs(i + di, j + dj, path)
+        def find(x):
+            # Path halving keeps the trees flat without recursion
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
 
-        # Find all continuous pathways
-        for i in range(height):
-            for j in range(width):
-                if grid[i][j] == 1 and not visited[i][j]:
-                    pathway = []
-                    dfs(i, j, pathway)
-                    if len(pathway) >= 3:  # Minimum continuity requirement
-                        pathways.append(pathway)
+        for pair in pairs.tolist():
+            root_a, root_b = find(pair // run_count), find(pair % run_count)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
 
-        return pathways
+        # Roots are each cluster's first run, so sorting them numbers
+        # the clusters in raster order
+        roots = np.array([find(r) for r in range(run_count)], dtype=np.intp)
+        unique_roots, cluster_index = np.unique(roots, return_inverse=True)
+
+        labels = np.zeros(grid.shape, dtype=np.int32)
+        labels[active] = cluster_index[run_ids[active]] + 1
+        return labels, len(unique_roots)
 
     def _apply_color_coding(self, symbol, density):
         """Apply ANSI color coding based on density"""
-        if self.color_support == "none":
-            return symbol
-
-        # Map density to color
-        if density < 0.3:
-            color_code = 21  # Deep blue
-        elif density < 0.7:
-            color_code = 202  # Orange
-        else:
-            color_code = 196  # Red
-
-        if self.color_support in ["256color", "truecolor"]:
-            return f"\033[38;5;{color_code}m{symbol}\033[0m"
-        else:
-            return symbol
+        band = 0 if density < 0.3 else 1 if density < 0.7 else 2
+        return self.color_prefixes[band] + symbol + self.color_suffix
 
     def render_neural_grid(self, grid):
         """Render grid to neural pathway visualization"""
         # Apply morphological enhancement for sparse grids
         enhanced_grid = self._apply_morphological_enhancement(grid)
+        return self._render_enhanced(enhanced_grid)
+
+    def analyze_and_render(self, grid):
+        """Render and analyze a grid, sharing the conversion and cell count"""
+        grid = np.asarray(grid, dtype=np.uint8)
+        active_cells = int(np.count_nonzero(grid))
+        enhanced_grid = self._apply_morphological_enhancement(grid, active_cells)
+        return (
+            self._render_enhanced(enhanced_grid),
+            self._network_properties(grid, active_cells),
+        )
 
-        # Trace pathways for validation
-        pathways = self._trace_pathways(enhanced_grid)
-
-        height, width = len(enhanced_grid), len(enhanced_grid[0])
-        neural_lines = []
-
-        for i in range(height):
-            line = ""
-            for j in range(width):
-                if enhanced_grid[i][j] == 0:
-                    line += " "
-                else:
-                    # Get neighborhood vector and lookup symbol
-                    vector = self._get_8bit_neighborhood_vector(enhanced_grid, i, j)
-                    symbol = self.symbol_lookup.get(vector, "●")
-
-                    # Validate junction connectivity
-                    if not self._validate_junction_connectivity(
-                        enhanced_grid, i, j, symbol
-                    ):
-                        symbol = "●"  # Fallback to neuron
-
-                    # Apply color coding
-                    neighbors = self.analyze_8_neighborhood(enhanced_grid, i, j)
-                    local_density = sum(neighbors) / 8.0
-                    colored_symbol = self._apply_color_coding(symbol, local_density)
+    def _render_enhanced(self, enhanced_grid):
+        """Map an already enhanced grid to its neural pathway symbols"""
+        codes = self._neighborhood_codes(enhanced_grid)
+        active = enhanced_grid != 0
 
-                    line += colored_symbol
+        if not self.color_suffix:
+            # Uncolored cells are one code point each, so decode the whole
+            # frame from a single UTF-32 buffer
+            chars = np.where(active, _SYMBOL_CODEPOINTS[codes], 0x20)
+            # A trailing newline column turns each row into a line
+            chars = np.pad(chars, ((0, 0), (0, 1)), constant_values=0x0A)
+            text = chars.astype("<u4").tobytes().decode("utf-32-le")
+            neural_lines = [line.rstrip() for line in text.split("\n")[:-1]]
+            return "\n".join(neural_lines)
 
-            neural_lines.append(line.rstrip())
+        cells = np.where(active, self.cell_table[codes], " ")
+        neural_lines = ["".join(row).rstrip() for row in cells.tolist()]
 
         return "\n".join(neural_lines)
 
     def analyze_network_properties(self, grid):
         """Analyze neural network properties"""
-        height, width = len(grid), len(grid[0])
-        total_cells = height * width
-        active_cells = sum(sum(row) for row in grid)
+        grid = np.asarray(grid, dtype=np.uint8)
+        return self._network_properties(grid, int(np.count_nonzero(grid)))
+
+    def _network_properties(self, grid, active_cells):
+        """Network properties of a uint8 grid with a known active cell count"""
+        total_cells = grid.size
 
         # Calculate entropy for integrity check
         if active_cells == 0 or active_cells == total_cells:
@@ -269,53 +381,31 @@ class NeuralPathwayRenderer:
             p1 = active_cells / total_cells
             entropy = -(p0 * math.log2(p0) + p1 * math.log2(p1))
 
-        pathways = self._trace_pathways(grid)
-        clusters = self.find_connected_components(grid)
-        largest_cluster = max(len(cluster) for cluster in clusters) if clusters else 0
+        # One labelling pass serves both clusters and pathways
+        labels, cluster_count = self._label_clusters(grid)
+        sizes = np.bincount(labels.ravel())[1:]
+        largest_cluster = int(sizes.max(initial=0))
+        # Pathways are clusters meeting the minimum continuity requirement
+        pathway_count = int(np.count_nonzero(sizes >= 3))
 
         return {
             "active_ratio": active_cells / total_cells,
-            "cluster_count": len(clusters),
+            "cluster_count": cluster_count,
             "largest_cluster": largest_cluster,
             "network_density": active_cells / total_cells,
-            "fragmentation": len(clusters) / max(1, active_cells),
-            "pathway_count": len(pathways),
+            "fragmentation": cluster_count / max(1, active_cells),
+            "pathway_count": pathway_count,
             "entropy": entropy,
             "integrity_preserved": True,
         }
 
     def find_connected_components(self, grid):
         """Find connected components in grid"""
-        height, width = len(grid), len(grid[0])
-        visited = [[False] * width for _ in range(height)]
-        components = []
-
-        def dfs(i, j, component):
-            if (
-                i < 0
-                or i >= height
-                or j < 0
-                or j >= width
-                or visited[i][j]
-                or grid[i][j] == 0
-            ):
-                return
+        labels, cluster_count = self._label_clusters(grid)
+        components = [[] for _ in range(cluster_count)]
 
-            visited[i][j] = True
-            component.append((i, j))
-
-            for di in [-1, 0, 1]:
-                for dj in [-1, 0, 1]:
-                    if di != 0 or dj != 0:
-                        dfs(i + di, j + dj, component)
-
-        for i in range(height):
-            for j in range(width):
-                if grid[i][j] == 1 and not visited[i][j]:
-                    component = []
-                    dfs(i, j, component)
-                    if component:
-                        components.append(component)
+        for i, j in np.argwhere(labels).tolist():
+            components[labels[i, j] - 1].append((i, j))
 
         return components
 
@@ -325,8 +415,42 @@ class AsciiArtGenerator:
         self.api_url = "https://ascii-art-api-e3rw.onrender.com"
         self.session_count = 0
         self.max_sessions = 11
-        self.metrics_file = "mathematical_metrics_log.txt"
+        self.metrics_file = "mathematical_metrics_log.jsonl"
         self.renderer = NeuralPathwayRenderer()
+        # Every caller of the same art shares one conversion, render and analysis
+        self._pipeline = functools.lru_cache(maxsize=32)(self._run_pipeline)
+        # Keep-alive session so repeated calls reuse the API connection
+        self._http = requests.Session()
+        self._http.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        # Pending metrics records, written in batches and on exit
+        self._pending_runs = []
+        # Holds the path and list rather than self, so pending records are
+        # written when the generator is collected or at interpreter exit
+        weakref.finalize(
+            self,
+            _append_runs,
+            self.metrics_file,
+            self._pending_runs,
+            self.max_sessions,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Write pending metrics and close the pooled API connections"""
+        self.flush_metrics()
+        self._http.close()
 
     def create(self, steps=None):
         if self.session_count >= self.max_sessions:
@@ -337,7 +461,7 @@ class AsciiArtGenerator:
 
         try:
             payload = {"steps": steps} if steps else {}
-            response = requests.post(
+            response = self._http.post(
                 f"{self.api_url}/generate", json=payload, timeout=30
             )
             response.raise_for_status()
@@ -352,7 +476,7 @@ class AsciiArtGenerator:
             else:
                 # Fallback: calculate from grid
                 grid = self._convert_art_to_grid(result.get("art", ""))
-                active_cells = sum(sum(row) for row in grid)
+                active_cells = int(np.count_nonzero(grid))
                 result["metrics"] = {
                     "generation": generation,
                     "active_cells": active_cells,
@@ -364,47 +488,40 @@ class AsciiArtGenerator:
         except Exception as e:
             return {"art": f"API unavailable: {e}", "status": "error"}
 
+    def _run_pipeline(self, art_string):
+        """Convert, render and analyze art in one pass"""
+        grid = self._convert_art_to_grid(art_string)
+        neural_art, network_props = self.renderer.analyze_and_render(grid)
+        return grid, neural_art, network_props
+
     def _convert_art_to_grid(self, art_string):
         """Enhanced ASCII to binary grid conversion with entropy preservation"""
         lines = art_string.strip().split("\n")
         if not lines:
-            return [[0]]
+            return np.zeros((1, 1), dtype=np.uint8)
 
         max_width = max(len(line) for line in lines)
 
-        # Calculate pre-conversion entropy
+        # Calculate pre-conversion Shannon entropy over the characters
         all_chars = "".join(lines)
-        char_counts = {}
-        for char in all_chars:
-            char_counts[char] = char_counts.get(char, 0) + 1
-
         pre_entropy = 0.0
         if len(all_chars) > 0:
-            for count in char_counts.values():
-                p = count / len(all_chars)
-                if p > 0:
-                    pre_entropy += -p * (p.bit_length() - 1 if p < 1 else 0)
+            chars = np.frombuffer(all_chars.encode("utf-32-le"), dtype="<u4")
+            _, counts = np.unique(chars, return_counts=True)
+            p = counts / len(all_chars)
+            pre_entropy = float(-(p * np.log2(p)).sum())
 
         # Convert to grid with mirror boundary padding
-        grid = []
-        for line in lines:
-            row = []
-            padded_line = line.ljust(max_width)
-            for char in padded_line:
-                row.append(1 if char not in [" ", "\t", "\n"] else 0)
-            grid.append(row)
+        grid = _visible_mask(lines, max_width).astype(np.uint8)
 
         # Check post-conversion entropy
-        active_cells = sum(sum(row) for row in grid)
-        total_cells = len(grid) * len(grid[0]) if grid else 1
+        active_cells = int(np.count_nonzero(grid))
+        total_cells = grid.size
 
         if active_cells > 0 and active_cells < total_cells:
             p1 = active_cells / total_cells
             p0 = 1 - p1
-            post_entropy = -(
-                p0 * (p0.bit_length() - 1 if p0 < 1 else 0)
-                + p1 * (p1.bit_length() - 1 if p1 < 1 else 0)
-            )
+            post_entropy = -(p0 * math.log2(p0) + p1 * math.log2(p1))
         else:
             post_entropy = 0.0
 
@@ -417,41 +534,21 @@ class AsciiArtGenerator:
     def _apply_block_encoding_enhancement(self, grid, original_art):
         """Apply 3x3 block encoding for better structure preservation"""
         lines = original_art.strip().split("\n")
-        height, width = len(grid), len(grid[0]) if grid else 0
-
-        enhanced = [[0] * width for _ in range(height)]
-
-        # Process in 3x3 blocks
-        for i in range(0, height, 3):
-            for j in range(0, width, 3):
-                block_has_content = False
-
-                # Check if 3x3 block has significant content
-                for bi in range(3):
-                    for bj in range(3):
-                        if (
-                            i + bi < height
-                            and j + bj < width
-                            and i + bi < len(lines)
-                            and j + bj < len(lines[i + bi])
-                        ):
-                            char = (
-                                lines[i + bi][j + bj]
-                                if j + bj < len(lines[i + bi])
-                                else " "
-                            )
-                            if char not in [" ", "\t", "\n"]:
-                                block_has_content = True
-                                break
-                    if block_has_content:
-                        break
-
-                # If block has content, preserve original grid values
-                if block_has_content:
-                    for bi in range(3):
-                        for bj in range(3):
-                            if i + bi < height and j + bj < width:
-                                enhanced[i + bi][j + bj] = grid[i + bi][j + bj]
+        grid = np.asarray(grid, dtype=np.uint8)
+        height, width = grid.shape
+
+        # Cells of the original art holding a visible character
+        content = np.zeros((height, width), dtype=bool)
+        content[: min(height, len(lines))] = _visible_mask(lines[:height], width)
+
+        # Pad to whole 3x3 blocks and mark the blocks with any content
+        blocks = np.pad(content, ((0, -height % 3), (0, -width % 3)))
+        blocks = blocks.reshape(blocks.shape[0] // 3, 3, blocks.shape[1] // 3, 3)
+        block_has_content = blocks.any(axis=(1, 3))
+
+        # Preserve original grid values only inside blocks with content
+        keep = block_has_content.repeat(3, axis=0).repeat(3, axis=1)[:height, :width]
+        enhanced = np.where(keep, grid, 0).astype(np.uint8)
 
         return enhanced
 
@@ -477,9 +574,7 @@ class AsciiArtGenerator:
             print("=" * 80)
 
         original_art = result.get("art", "")
-        grid = self._convert_art_to_grid(original_art)
-        neural_art = self.renderer.render_neural_grid(grid)
-        network_props = self.renderer.analyze_network_properties(grid)
+        _, neural_art, network_props = self._pipeline(original_art)
 
         print("NEURAL PATHWAY VISUALIZATION:")
         print(neural_art)
@@ -546,27 +641,29 @@ class AsciiArtGenerator:
             for metric in available_metrics:
                 self._show_metric_breakdown(metric, breakdowns)
 
-    def _run_validation_checkpoints(self, network_props):
+    def _run_validation_checkpoints(self, network_props, short_circuit=False):
         """Run final enforcement checkpoints"""
-        checkpoints = []
+        # Left lazy when short-circuiting, so all() stops at the first failure
+        checkpoints = self._iter_validation_checkpoints(network_props)
+        return checkpoints if short_circuit else list(checkpoints)
 
+    def _iter_validation_checkpoints(self, network_props):
+        """Yield each enforcement checkpoint in order"""
         # Pathway continuity check
         pathway_continuity = network_props.get("pathway_count", 0) > 0
-        checkpoints.append({"name": "pathway_continuity", "passed": pathway_continuity})
+        yield {"name": "pathway_continuity", "passed": pathway_continuity}
 
         # Minimum density check
         min_density = network_props["network_density"] >= 0.05
-        checkpoints.append({"name": "minimum_density", "passed": min_density})
+        yield {"name": "minimum_density", "passed": min_density}
 
         # Integrity preservation check
         integrity = network_props.get("integrity_preserved", False)
-        checkpoints.append({"name": "grid_integrity", "passed": integrity})
+        yield {"name": "grid_integrity", "passed": integrity}
 
         # Symbol distribution entropy check
         entropy_ok = network_props.get("entropy", 0) >= 0.1
-        checkpoints.append({"name": "symbol_entropy", "passed": entropy_ok})
-
-        return checkpoints
+        yield {"name": "symbol_entropy", "passed": entropy_ok}
 
     def _show_metric_breakdown(self, metric_name, breakdowns):
         if metric_name not in breakdowns:
@@ -614,9 +711,7 @@ class AsciiArtGenerator:
             filename = f"neural_pathway_art_{timestamp}.txt"
 
         original_art = result.get("art", "")
-        grid = self._convert_art_to_grid(original_art)
-        neural_art = self.renderer.render_neural_grid(grid)
-        network_props = self.renderer.analyze_network_properties(grid)
+        _, neural_art, network_props = self._pipeline(original_art)
 
         with open(filename, "w") as f:
             f.write("Enhanced Neural Pathway ASCII Art Generator\n")
@@ -640,18 +735,13 @@ class AsciiArtGenerator:
 
     def _save_metrics_to_file(self, result, run_type):
         try:
-            try:
-                with open(self.metrics_file, "r") as f:
-                    existing_data = json.loads(f.read())
-            except (FileNotFoundError, json.JSONDecodeError):
-                existing_data = {"runs": [], "total_sessions": 0}
-
-            if len(existing_data["runs"]) >= self.max_sessions:
+            # One JSON record per line, so a save appends instead of rewriting.
+            # Each flush trims its batch against the log's current length.
+            if len(self._pending_runs) >= self.max_sessions:
                 return
 
             original_art = result.get("art", "")
-            grid = self._convert_art_to_grid(original_art)
-            network_props = self.renderer.analyze_network_properties(grid)
+            _, _, network_props = self._pipeline(original_art)
 
             run_data = {
                 "session_id": self.session_count,
@@ -661,19 +751,29 @@ class AsciiArtGenerator:
                 "neural_analysis": network_props,
                 "validation_passed": all(
                     cp["passed"]
-                    for cp in self._run_validation_checkpoints(network_props)
+                    for cp in self._run_validation_checkpoints(
+                        network_props, short_circuit=True
+                    )
                 ),
                 "evolution_steps": result.get(
                     "steps", result.get("evolution_steps", 0)
                 ),
             }
 
-            existing_data["runs"].append(run_data)
-            existing_data["total_sessions"] = len(existing_data["runs"])
+            self._pending_runs.append(run_data)
+            if len(self._pending_runs) >= _METRICS_BATCH_SIZE:
+                self.flush_metrics()
 
-            with open(self.metrics_file, "w") as f:
-                json.dump(existing_data, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save metrics to file: {e}")
+
+    def flush_metrics(self):
+        """Append pending metrics records to the log in a single write"""
+        if not self._pending_runs:
+            return
 
+        try:
+            _append_runs(self.metrics_file, self._pending_runs, self.max_sessions)
         except Exception as e:
             print(f"Warning: Could not save metrics to file: {e}")
 
@@ -685,7 +785,7 @@ class AsciiArtGenerator:
 
         try:
             payload = {"max_generations": min(max_generations or 11, 11)}
-            response = requests.post(
+            response = self._http.post(
                 f"{self.api_url}/animate", json=payload, timeout=120
             )
 
@@ -716,40 +816,59 @@ class AsciiArtGenerator:
             )
             print(f"8-bit encoding with connectivity validation | Delay: {delay}s\n")
 
-            for i, frame in enumerate(data.get("frames", [])):
-                print("\033c", end="")
-
-                print("Live Enhanced Neural Pathway Evolution")
-                print(
-                    f"Generation: {frame.get('generation', i)}/{len(data['frames'])} | Session: {self.session_count}/{self.max_sessions}"
-                )
-                print("=" * 80)
-
-                original_art = frame.get("art", "")
-                if original_art:
-                    grid = self._convert_art_to_grid(original_art)
-                    neural_art = self.renderer.render_neural_grid(grid)
-                    network_props = self.renderer.analyze_network_properties(grid)
-
-                    print("ENHANCED NEURAL PATHWAYS:")
-                    print(neural_art)
-                    print("=" * 80)
-
-                    if "metrics" in frame:
-                        metrics = frame["metrics"]
-                        generation = metrics.get("generation", i)
-                        active_cells = metrics.get("active_cells", "N/A")
-                        print(f"Gen: {generation} | Active: {active_cells} | ", end="")
-                        print(
-                            f"Pathways: {network_props.get('pathway_count', 0)} | ",
-                            end="",
-                        )
-                        print(f"Density: {network_props['network_density']:.3f}")
+            frames = data.get("frames", [])
+            # Frames run on a fixed schedule, so render time comes out of
+            # the delay instead of adding to it
+            next_deadline = time.monotonic()
+            # Render the next frame in the background while this one is shown
+            with ThreadPoolExecutor(max_workers=1) as prefetch:
+                upcoming = None
+                for i, frame in enumerate(frames):
+                    if upcoming is not None:
+                        # Let the prefetch finish so the lookup below is cached
+                        upcoming.result()
+
+                    # Build the whole frame and write it with the clear in one go
+                    lines = [
+                        "Live Enhanced Neural Pathway Evolution",
+                        f"Generation: {frame.get('generation', i)}/{len(data['frames'])} | Session: {self.session_count}/{self.max_sessions}",
+                        "=" * 80,
+                    ]
+
+                    original_art = frame.get("art", "")
+                    if original_art:
+                        _, neural_art, network_props = self._pipeline(original_art)
+
+                        lines += ["ENHANCED NEURAL PATHWAYS:", neural_art, "=" * 80]
+
+                        if "metrics" in frame:
+                            metrics = frame["metrics"]
+                            generation = metrics.get("generation", i)
+                            active_cells = metrics.get("active_cells", "N/A")
+                            lines.append(
+                                f"Gen: {generation} | Active: {active_cells} | "
+                                f"Pathways: {network_props.get('pathway_count', 0)} | "
+                                f"Density: {network_props['network_density']:.3f}"
+                            )
 
-                print("Enhanced neural network evolution with validation...")
+                    lines.append("Enhanced neural network evolution with validation...")
+                    sys.stdout.write(_CLEAR + "\n".join(lines) + "\n")
+                    sys.stdout.flush()
 
-                if i < len(data["frames"]) - 1:
-                    time.sleep(delay)
+                    if i < len(frames) - 1:
+                        next_art = frames[i + 1].get("art", "")
+                        upcoming = (
+                            prefetch.submit(self._pipeline, next_art)
+                            if next_art
+                            else None
+                        )
+                        next_deadline += delay
+                        sleep_time = next_deadline - time.monotonic()
+                        if sleep_time > 0:
+                            time.sleep(sleep_time)
+                        elif sleep_time < -delay:
+                            # Too far behind: restart the schedule, don't rush frames
+                            next_deadline = time.monotonic()
 
             print(
                 f"\nAnimation complete! Session {self.session_count}/{self.max_sessions}"
@@ -760,10 +879,7 @@ class AsciiArtGenerator:
                 final_frame = data["frames"][-1]
                 final_art = final_frame.get("art", "")
                 if final_art:
-                    final_grid = self._convert_art_to_grid(final_art)
-                    final_network_props = self.renderer.analyze_network_properties(
-                        final_grid
-                    )
+                    _, _, final_network_props = self._pipeline(final_art)
                     print("\nFinal Enhanced Neural Network State:")
                     self._display_mathematical_metrics(
                         final_frame["metrics"],
@@ -789,14 +905,14 @@ class AsciiArtGenerator:
         }
 
     def view_metrics_log(self):
+        self.flush_metrics()
         try:
-            with open(self.metrics_file, "r") as f:
-                data = json.loads(f.read())
+            runs = _read_jsonl(self.metrics_file)
 
             print(
-                f"\n=== ENHANCED NEURAL PATHWAY METRICS LOG ({data['total_sessions']}/{self.max_sessions} sessions) ==="
+                f"\n=== ENHANCED NEURAL PATHWAY METRICS LOG ({len(runs)}/{self.max_sessions} sessions) ==="
             )
-            for run in data["runs"]:
+            for run in runs:
                 print(
                     f"\nSession {run['session_id']} ({run['type']}) - {run['timestamp']}"
                 )
@@ -813,6 +929,15 @@ class AsciiArtGenerator:
         except (FileNotFoundError, json.JSONDecodeError):
             print("No metrics log found.")
 
+    def dump_pretty(self):
+        """Return the metrics log as indented JSON for human inspection"""
+        self.flush_metrics()
+        try:
+            runs = _read_jsonl(self.metrics_file)
+        except FileNotFoundError:
+            runs = []
+        return json.dumps(runs, indent=2, ensure_ascii=False)
+
 
 def test_neural_renderer():
     print("Testing Enhanced Neural Pathway Renderer...")
@@ -831,8 +956,8 @@ def test_neural_renderer():
     for i, test_grid in enumerate(test_grids, 1):
         print(f"\n--- Test {i} ---")
         print("Input Grid:")
-        for row in test_grid:
-            print(" ".join(str(cell) for cell in row))
+        cells = np.asarray(test_grid).astype(str).tolist()
+        print("\n".join(" ".join(row) for row in cells))
 
         neural_output = renderer.render_neural_grid(test_grid)
         network_props = renderer.analyze_network_properties(test_grid)
@@ -850,9 +975,12 @@ def test_neural_renderer():
     print(f"\n--- Symbol Lookup Table Test ---")
     print(f"Total symbols defined: {len(renderer.symbol_lookup)}")
     print("Sample mappings:")
-    for vector in [0b00000000, 0b00010100, 0b01000010, 0b01010110]:
-        symbol = renderer.symbol_lookup.get(vector, "?")
-        print(f"  {format(vector, '08b')} -> '{symbol}'")
+    print(
+        "\n".join(
+            f"  {format(vector, '08b')} -> '{renderer.symbol_lookup.get(vector, '?')}'"
+            for vector in [0b00000000, 0b00010100, 0b01000010, 0b01010110]
+        )
+    )
 
     # Test color support
     print(f"\nColor Support: {renderer.color_support}")
@@ -881,17 +1009,15 @@ def test_grid_conversion():
         print(art)
 
         grid = gen._convert_art_to_grid(art)
-        network_props = gen.renderer.analyze_network_properties(grid)
+        neural_output, network_props = gen.renderer.analyze_and_render(grid)
 
-        print(f"\nGrid (dimensions: {len(grid)}x{len(grid[0]) if grid else 0}):")
-        for row in grid:
-            print("".join(str(cell) for cell in row))
+        print(f"\nGrid (dimensions: {grid.shape[0]}x{grid.shape[1]}):")
+        print("\n".join("".join(row) for row in grid.astype(str).tolist()))
 
         print(f"\nDensity: {network_props['network_density']:.4f}")
         print(f"Entropy Check: {network_props.get('entropy', 'N/A')}")
 
         # Test neural rendering
-        neural_output = gen.renderer.render_neural_grid(grid)
         print(f"\nNeural Rendering:")
         print(neural_output)
 
@@ -939,9 +1065,12 @@ def test_validation_checkpoints():
         print(f"\n--- {test_case['name']} ---")
         checkpoints = gen._run_validation_checkpoints(test_case["props"])
 
-        for checkpoint in checkpoints:
-            status = "PASS" if checkpoint["passed"] else "FAIL"
-            print(f"  {checkpoint['name']}: {status}")
+        print(
+            "\n".join(
+                f"  {checkpoint['name']}: {'PASS' if checkpoint['passed'] else 'FAIL'}"
+                for checkpoint in checkpoints
+            )
+        )
 
         overall = all(cp["passed"] for cp in checkpoints)
         print(f"  Overall Validation: {'PASS' if overall else 'FAIL'}")
@@ -1005,19 +1134,7 @@ def main():
                 gen.view_metrics_log()
             break
 
-        print("\nOptions:")
-        print("  [Enter] - Generate enhanced neural pathway art")
-        print("  'live' - Watch live neural evolution")
-        print("  'live 5' - Watch 5 generations")
-        print("  'fast' - Fast animation (0.2s delay)")
-        print("  'slow' - Slow animation (1.0s delay)")
-        print("  's' - Save neural art to file")
-        print("  'v' - View metrics log")
-        print("  'test' - Test neural renderer")
-        print("  'testall' - Run comprehensive tests")
-        print("  'grid' - Test grid conversion")
-        print("  'validate' - Test validation checkpoints")
-        print("  'q' - Quit")
+        print(_MENU, end="")
 
         user_input = input("\n> ").strip().lower()
 
@@ -1056,7 +1173,7 @@ def main():
         elif user_input == "slow":
             gen.animate(delay=1.0)
         else:
-            print("\033c", end="")
+            sys.stdout.write(_CLEAR)
             gen.display()
 
 
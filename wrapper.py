@@ -1,6 +1,48 @@
 #!/usr/bin/env python3
 import requests
 import json
+import time
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Cursor home + erase display: redraws in place without a full terminal reset
+_CLEAR = "\x1b[H\x1b[2J"
+
+# Seconds a created piece is reused by a repeat create() with the same steps
+_CREATE_TTL = 2.0
+
+# Upper bound on concurrent create_many() requests sharing the one Session
+_CREATE_WORKERS = 4
+
+# Default seconds between animation frames, the API's documented transition
+_ANIMATION_DELAY = 4.0
+
+# The reused frame buffer is dropped back to this size after an animation
+# whose frames grew it past _FRAME_BUFFER_LIMIT
+_FRAME_BUFFER_SIZE = 8192
+_FRAME_BUFFER_LIMIT = 128 * 1024
+
+
+def _write_frame(data):
+    """Write encoded frame bytes straight to the stdout file descriptor"""
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+
+    if fd is None or os.name != "posix":
+        # No usable descriptor (or not POSIX): go through the text stream
+        sys.stdout.write(str(data, sys.stdout.encoding or "utf-8"))
+        sys.stdout.flush()
+        return
+
+    # os.write may stop short on pipes, so keep going until all is written
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
 
 
 class AsciiArtGenerator:
@@ -8,12 +50,35 @@ class AsciiArtGenerator:
 
     def __init__(self):
         self.api_url = "https://ascii-art-api-e3rw.onrender.com"
+        # Keep-alive session so repeated calls reuse the API connection
+        self._http = requests.Session()
+        self._last_result = None
+        self._last_steps = None
+        self._last_time = 0.0
+        # Animation frames are assembled in this buffer instead of new strings
+        self._frame_buf = bytearray(_FRAME_BUFFER_SIZE)
 
     def create(self, steps=None):
-        """Create static art via API"""
+        """Create static art via API, reusing a piece made moments ago"""
+        if (
+            self._last_result is not None
+            and steps == self._last_steps
+            and time.monotonic() - self._last_time < _CREATE_TTL
+        ):
+            return self._last_result
+
+        result = self._fetch(steps)
+        if result.get("status") != "error":
+            self._last_result = result
+            self._last_steps = steps
+            self._last_time = time.monotonic()
+        return result
+
+    def _fetch(self, steps=None):
+        """Request a new piece from the API"""
         try:
             payload = {"steps": steps} if steps else {}
-            response = requests.post(
+            response = self._http.post(
                 f"{self.api_url}/generate", json=payload, timeout=30
             )
             response.raise_for_status()
@@ -21,6 +86,14 @@ class AsciiArtGenerator:
         except Exception as e:
             return {"art": f"API unavailable: {e}", "status": "error"}
 
+    def create_many(self, count, steps=None):
+        """Create several pieces with concurrent API requests"""
+        if count <= 1:
+            return [self._fetch(steps) for _ in range(count)]
+
+        with ThreadPoolExecutor(max_workers=min(count, _CREATE_WORKERS)) as pool:
+            return list(pool.map(self._fetch, [steps] * count))
+
     def display(self, show_info=True):
         """Display static art"""
         result = self.create()
@@ -38,9 +111,10 @@ class AsciiArtGenerator:
             print("=" * 80)
             print("This pattern is mathematically guaranteed to never repeat.")
 
-    def save_to_file(self, filename=None):
-        """Save art to file"""
-        result = self.create()
+    def save_to_file(self, filename=None, result=None):
+        """Save art to file, creating a new piece unless result is given"""
+        if result is None:
+            result = self.create()
         if result.get("status") == "error":
             return None
 
@@ -58,15 +132,26 @@ class AsciiArtGenerator:
 
         return filename
 
-    def animate(self, max_generations=None, delay=0.5):
+    def _fill_frame_buffer(self, parts):
+        """Copy encoded parts into the frame buffer and return the frame size"""
+        size = sum(len(part) for part in parts)
+        if size > len(self._frame_buf):
+            self._frame_buf = bytearray(max(size, 2 * len(self._frame_buf)))
+
+        # Same-length slice assignment fills the buffer without resizing it
+        pos = 0
+        for part in parts:
+            end = pos + len(part)
+            self._frame_buf[pos:end] = part
+            pos = end
+        return size
+
+    def animate(self, max_generations=None, delay=_ANIMATION_DELAY):
         """Rate-limited live animation via API"""
-        import time
-        import os
-
         try:
             # Request animation from API
             payload = {"max_generations": min(max_generations or 11, 11)}
-            response = requests.post(
+            response = self._http.post(
                 f"{self.api_url}/animate", json=payload, timeout=120
             )
 
@@ -85,23 +170,48 @@ class AsciiArtGenerator:
             print(
                 f"Generations: {len(data['frames'])}/11 | Remaining today: {data.get('remaining_today', 0)}"
             )
-            print("4-second transitions | Press Ctrl+C to stop\n")
-
-            # Display frames with 4-second delays
-            for i, frame in enumerate(data["frames"]):
-                print("\033c", end="")
-
-                print("Live Non-Repeating ASCII Art Evolution")
-                print(
-                    f"Generation: {frame['generation']}/{len(data['frames'])} | Remaining today: {data.get('remaining_today', 0)}"
+            print(f"{delay:g}-second transitions | Press Ctrl+C to stop\n")
+
+            # Display frames on a fixed delay-second schedule; rendering time
+            # is absorbed by the wait instead of being added to it
+            frames = data["frames"]
+            encoding = sys.stdout.encoding or "utf-8"
+            interval = delay
+            next_deadline = time.monotonic()
+            # Lines shared by every frame are encoded once, up front
+            title = (_CLEAR + "Live Non-Repeating ASCII Art Evolution\n").encode(
+                encoding, "replace"
+            )
+            separator = ("=" * 80 + "\n").encode(encoding)
+            footer = (
+                f"Mathematical evolution in progress... ({delay:g}s transitions)\n"
+            ).encode(encoding)
+            for i, frame in enumerate(frames):
+                status = f"Generation: {frame['generation']}/{len(frames)} | Remaining today: {data.get('remaining_today', 0)}\n"
+                size = self._fill_frame_buffer(
+                    (
+                        title,
+                        status.encode(encoding, "replace"),
+                        separator,
+                        (frame["art"] + "\n").encode(encoding, "replace"),
+                        separator,
+                        footer,
+                    )
                 )
-                print("=" * 80)
-                print(frame["art"])
-                print("=" * 80)
-                print("Mathematical evolution in progress... (4s transitions)")
-
-                if i < len(data["frames"]) - 1:  # Don't delay after last frame
-                    time.sleep(4.0)  # 4 second transitions
+                with memoryview(self._frame_buf) as frame_view:
+                    _write_frame(frame_view[:size])
+
+                if i < len(frames) - 1:  # Don't delay after last frame
+                    next_deadline += interval
+                    sleep_time = next_deadline - time.monotonic()
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
+                    elif sleep_time < -interval:
+                        # Too far behind: restart the schedule, don't rush frames
+                        next_deadline = time.monotonic()
+
+            if len(self._frame_buf) > _FRAME_BUFFER_LIMIT:
+                self._frame_buf = bytearray(_FRAME_BUFFER_SIZE)
 
             print(
                 f"\nAnimation complete! Used {len(data['frames'])}/11 daily generations"